@@ -91,6 +91,10 @@ class OpenRouterClient:
             result = response.json()
             yield result["choices"][0]["message"]["content"]
 
+    async def warmup(self):
+        """Open a pooled connection to OpenRouter ahead of the first request"""
+        await self.client.head(self.BASE_URL)
+
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
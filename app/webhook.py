@@ -1,9 +1,12 @@
 """
 FastAPI Webhook Handler - Main orchestrator
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException, Header
 from fastapi.responses import JSONResponse
+import asyncio
 import httpx
+import logging
 import os
 from typing import Optional
 
@@ -11,28 +14,113 @@ from .session_manager import SessionManager
 from .model_router import ModelRouter
 from .models.openrouter import OpenRouterClient
 
-# Initialize
-app = FastAPI(title="Pavle's Telegram Agent Orchestrator")
-session_manager = SessionManager()
-model_router = ModelRouter()
-openrouter = OpenRouterClient()
+logger = logging.getLogger(__name__)
 
 # Config
-TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-if not TELEGRAM_TOKEN:
-    raise ValueError("TELEGRAM_TOKEN environment variable must be set")
 SECRET_TOKEN = os.getenv("SECRET_TOKEN", "CHANGE_ME_IN_PRODUCTION")
+WARMUP_RETRY_MAX_DELAY = 60.0  # seconds between warmup retries, at most
+
+
+def describe_error(error: BaseException) -> str:
+    """Summarize an error without its message, which may embed the bot token URL"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}"
+    return type(error).__name__
+
+
+def mark_warm(app: FastAPI, name: str, ok: bool):
+    """Record a warmup step result and recompute readiness"""
+    app.state.warmup[name] = ok
+    app.state.ready = all(app.state.warmup.values())
+
+
+async def load_free_models(app: FastAPI) -> list:
+    """Refresh the free model catalog snapshot from the router database"""
+    models = await asyncio.to_thread(app.state.model_router.list_available_models, True)
+    app.state.free_models = models
+    mark_warm(app, "models", True)
+    return models
+
+
+async def warmup(app: FastAPI):
+    """
+    Warm connection pools and the model catalog snapshot concurrently
+
+    Failed steps are retried with exponential backoff until all succeed.
+    """
+    state = app.state
+
+    async def warm_telegram():
+        response = await state.telegram.post("/getMe")
+        response.raise_for_status()
+
+    steps = {
+        "telegram": warm_telegram,
+        "openrouter": state.openrouter.warmup,
+        "models": lambda: load_free_models(app),
+    }
+
+    delay = 1.0
+    while True:
+        pending = [name for name in steps if not state.warmup[name]]
+        if not pending:
+            return
+
+        results = await asyncio.gather(
+            *(steps[name]() for name in pending),
+            return_exceptions=True
+        )
+        for name, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.warning("Warmup of %s failed: %s", name, describe_error(result))
+                mark_warm(app, name, False)
+            else:
+                mark_warm(app, name, True)
+
+        if not state.ready:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX_DELAY)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared components once per worker and close them on shutdown"""
+    telegram_token = os.getenv("TELEGRAM_TOKEN")
+    if not telegram_token:
+        raise ValueError("TELEGRAM_TOKEN environment variable must be set")
+
+    state = app.state
+    state.ready = False
+    state.warmup = {"telegram": False, "openrouter": False, "models": False}
+    state.free_models = []
+    state.session_manager = SessionManager()
+    state.model_router = await asyncio.to_thread(ModelRouter)
+    state.openrouter = OpenRouterClient()
+    state.telegram = httpx.AsyncClient(
+        base_url=f"https://api.telegram.org/bot{telegram_token}"
+    )
+    warmup_task = asyncio.create_task(warmup(app))
+
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+        await state.openrouter.close()
+        await state.telegram.aclose()
+
+
+# Initialize
+app = FastAPI(title="Pavle's Telegram Agent Orchestrator", lifespan=lifespan)
 
 
 async def send_telegram_message(chat_id: int, text: str, parse_mode: str = "Markdown"):
     """Send message to Telegram"""
-    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-    async with httpx.AsyncClient() as client:
-        await client.post(url, json={
-            "chat_id": chat_id,
-            "text": text,
-            "parse_mode": parse_mode
-        })
+    await app.state.telegram.post("/sendMessage", json={
+        "chat_id": chat_id,
+        "text": text,
+        "parse_mode": parse_mode
+    })
 
 
 @app.post("/telegram/webhook")
@@ -70,6 +158,7 @@ async def telegram_webhook(
 
 async def handle_command(user_id: int, chat_id: int, text: str):
     """Handle bot commands"""
+    session_manager = app.state.session_manager
     parts = text.split(maxsplit=1)
     command = parts[0][1:]  # Remove /
     args = parts[1] if len(parts) > 1 else ""
@@ -93,7 +182,7 @@ Just send me a message to start coding!
 """)
 
     elif command == "models":
-        models = model_router.list_available_models(free_only=True)
+        models = app.state.free_models or await load_free_models(app)
         text = "**Available FREE models:**\n\n"
         for m in models[:10]:
             text += f"• `{m['model_id']}`\n  {m['name']} ({m['context']} context, score: {m['score']})\n\n"
@@ -126,6 +215,9 @@ Just send me a message to start coding!
 
 async def handle_message(user_id: int, chat_id: int, text: str):
     """Handle regular messages - call LLM"""
+    session_manager = app.state.session_manager
+    telegram = app.state.telegram
+
     # Load session
     session = session_manager.load_session(user_id)
 
@@ -158,43 +250,37 @@ When suggesting file changes, show exact diffs or complete updated files.
         response_text = ""
         message_id = None
 
-        async for chunk in openrouter.chat_completion(model, full_messages, stream=True):
+        async for chunk in app.state.openrouter.chat_completion(model, full_messages, stream=True):
             response_text += chunk
 
             # Update message every 50 chars
             if len(response_text) % 50 == 0:
                 if message_id:
                     # Edit existing message
-                    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/editMessageText"
-                    async with httpx.AsyncClient() as client:
-                        await client.post(url, json={
-                            "chat_id": chat_id,
-                            "message_id": message_id,
-                            "text": response_text[:4096],  # Telegram limit
-                            "parse_mode": "Markdown"
-                        })
+                    await telegram.post("/editMessageText", json={
+                        "chat_id": chat_id,
+                        "message_id": message_id,
+                        "text": response_text[:4096],  # Telegram limit
+                        "parse_mode": "Markdown"
+                    })
                 else:
                     # Send initial message
-                    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-                    async with httpx.AsyncClient() as client:
-                        result = await client.post(url, json={
-                            "chat_id": chat_id,
-                            "text": response_text[:4096],
-                            "parse_mode": "Markdown"
-                        })
-                        data = result.json()
-                        message_id = data.get("result", {}).get("message_id")
+                    result = await telegram.post("/sendMessage", json={
+                        "chat_id": chat_id,
+                        "text": response_text[:4096],
+                        "parse_mode": "Markdown"
+                    })
+                    data = result.json()
+                    message_id = data.get("result", {}).get("message_id")
 
         # Final update
         if message_id:
-            url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/editMessageText"
-            async with httpx.AsyncClient() as client:
-                await client.post(url, json={
-                    "chat_id": chat_id,
-                    "message_id": message_id,
-                    "text": response_text[:4096],
-                    "parse_mode": "Markdown"
-                })
+            await telegram.post("/editMessageText", json={
+                "chat_id": chat_id,
+                "message_id": message_id,
+                "text": response_text[:4096],
+                "parse_mode": "Markdown"
+            })
 
         # Save assistant message
         session_manager.add_message(user_id, "assistant", response_text)
@@ -205,8 +291,14 @@ When suggesting file changes, show exact diffs or complete updated files.
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "telegram-orchestrator"}
+    """Health check endpoint - liveness plus warmup readiness"""
+    return {
+        "status": "healthy",
+        "service": "telegram-orchestrator",
+        "ready": app.state.ready,
+        "warmup": app.state.warmup,
+        "free_models": len(app.state.free_models)
+    }
 
 
 @app.get("/")